@@ -1,7 +1,9 @@
 import logging
+import time
 
 import requests
-import user_agent 
+import user_agent
+from requests.adapters import HTTPAdapter
 
 from utils import formatter
 
@@ -17,15 +19,38 @@ class RecreationClient:
     MAIN_PAGE_ENDPOINT = BASE_URL + "/api/camps/campgrounds/{park_id}"
 
     headers = {"User-Agent": user_agent.generate_user_agent() }
-    
+
+    # One pooled session shared by all requests - concurrent park checks
+    # reuse keep-alive connections to recreation.gov instead of paying a
+    # fresh TCP+TLS handshake per call. The default adapter only keeps 10
+    # connections per host, which the threaded search x park fan-out
+    # overflows (evicted connections are closed, not reused), so mount
+    # one sized like the handler's Telegram session and S3 client.
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
+    # Availability responses cached per (park_id, month) for a short TTL.
+    # Overlapping searches in one run - and warm Lambda containers on a
+    # tight schedule - reuse the response instead of re-hitting the API,
+    # which also eases recreation.gov rate-limit pressure. The short TTL
+    # bounds staleness.
+    AVAILABILITY_CACHE_TTL_SECONDS = 60
+    _availability_cache = {}
+
     @classmethod
     def get_availability(cls, park_id, month_date):
         params = {"start_date": formatter.format_date(month_date)}
+        cache_key = (park_id, params["start_date"])
+        cached = cls._availability_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < cls.AVAILABILITY_CACHE_TTL_SECONDS:
+            LOG.debug("Availability cache hit for {}".format(cache_key))
+            return cached[1]
         LOG.debug(
             "Querying for {} with these params: {}".format(park_id, params)
         )
         url = cls.AVAILABILITY_ENDPOINT.format(park_id=park_id)
         resp = cls._send_request(url, params)
+        cls._availability_cache[cache_key] = (time.monotonic(), resp)
         return resp
 
     @classmethod
@@ -37,7 +62,7 @@ class RecreationClient:
 
     @classmethod
     def _send_request(cls, url, params):
-        resp = requests.get(url, params=params, headers=cls.headers)
+        resp = cls.session.get(url, params=params, headers=cls.headers)
         if resp.status_code != 200:
             raise RuntimeError(
                 "failedRequest",
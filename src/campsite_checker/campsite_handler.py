@@ -5,22 +5,31 @@ Loads per-user search configurations from S3 and checks multiple campsite/date c
 Sends notifications via Telegram when availability is found.
 """
 
+import gzip
 import json
+import logging
 import urllib.request
 import urllib.parse
 import os
-import boto3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import re
 
-# Load environment variables when running locally (only import dotenv if available)
-try:
-    from dotenv import load_dotenv
-    if os.path.exists('.env'):
-        load_dotenv()
-except ImportError:
-    # dotenv not available (e.g., in Lambda), which is fine
-    pass
+LOG = logging.getLogger(__name__)
+LOG.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Load environment variables when running locally (only import dotenv if
+# available). Skipped entirely in Lambda - AWS always sets
+# AWS_LAMBDA_FUNCTION_NAME there - so cold starts don't pay the dotenv
+# import or the .env stat.
+if 'AWS_LAMBDA_FUNCTION_NAME' not in os.environ:
+    try:
+        from dotenv import load_dotenv
+        if os.path.exists('.env'):
+            load_dotenv()
+    except ImportError:
+        # dotenv not available, which is fine
+        pass
 
 # Import your camping functionality
 try:
@@ -30,59 +39,233 @@ except ImportError:
     CAMPING_AVAILABLE = False
     print("Warning: camping module not available")
 
-def load_user_config(bucket_name, user_id):
-    """Load user-specific search configuration from S3"""
-    s3 = boto3.client('s3')
+# Pooled keep-alive session so repeated Telegram sends in one invocation
+# (and across warm invocations) reuse a single TLS connection instead of
+# paying a fresh handshake per message. requests ships with the camping
+# bundle; fall back to urllib if it isn't available.
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    _HTTP_SESSION = requests.Session()
+    # Pool sized for the concurrent per-user delivery fan-out; transient
+    # Telegram 429/5xx responses are retried with a short backoff instead
+    # of dropping the notification
+    _HTTP_SESSION.mount('https://', HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=None,
+        ),
+    ))
+except ImportError:
+    _HTTP_SESSION = None
+
+# orjson is a C extension that parses and serializes JSON several times
+# faster than the stdlib and accepts bytes directly (no decode step). Fall
+# back to stdlib json when it isn't bundled.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+# Environment lookups cached at module load (after dotenv above) - these
+# never change within a container's lifetime, so don't re-read them per call
+_TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
+_CONFIG_BUCKET = os.environ.get('CONFIG_BUCKET')
+
+# sendMessage URL precomputed for the configured bot token; rebuilt per
+# call only when a different token is supplied in the event
+_TELEGRAM_SEND_URL = (
+    f"https://api.telegram.org/bot{_TELEGRAM_BOT_TOKEN}/sendMessage"
+    if _TELEGRAM_BOT_TOKEN else None
+)
+
+# Bound every outbound HTTP call so a degraded endpoint can't hold the
+# Lambda until its hard timeout
+_HTTP_TIMEOUT_SECONDS = 10
+
+SUCCESS_EMOJI = "🏕"
+FAILURE_EMOJI = "❌"
+
+# Matches camping output lines like
+# "🏕 Park Name (232448): 3 site(s) available out of 10 site(s)"
+# capturing the park name and the available-site count in one pass.
+_AVAILABILITY_LINE_RE = re.compile(
+    rf"{SUCCESS_EMOJI}\s*([^(:\n]+)[^:\n]*:\s*(\d+)"
+)
+
+# HTML tags stripped before sending plain-text Telegram fallbacks
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Pre-serialized skeleton for the critical-failure response - the error
+# branch interpolates the (JSON-escaped) message instead of building a
+# dict and running a full dumps pass, which matters when a failing
+# invocation is being retried on a schedule
+_ERROR_BODY_TEMPLATE = '{"error":%s,"message":"Critical lambda failure"}'
+
+# Transient-error markers (rate limits, timeouts, flaky upstreams) that
+# shouldn't page the user - one compiled alternation, one scan per error
+_TRANSIENT_ERROR_RE = re.compile(
+    r'429|rate limit|too many requests|timeout|timed out|connection'
+    r'|network|temporarily unavailable|service unavailable|503|502|504',
+    re.IGNORECASE,
+)
+
+# Created lazily and reused across warm invocations - boto3 client
+# construction is slow (service model load + credential resolution)
+_S3_CLIENT = None
+
+def _get_s3():
+    """Return the shared S3 client, creating it on first use"""
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        # Deferred so the heavy botocore import is only paid when S3 is
+        # actually touched (e.g. never during camping-only local runs).
+        # Pool sized so the threaded config fan-out isn't throttled by
+        # the default 10-connection urllib3 pool.
+        import boto3
+        from botocore.config import Config
+        _S3_CLIENT = boto3.client('s3', config=Config(
+            max_pool_connections=50,
+            retries={'max_attempts': 3, 'mode': 'standard'},
+        ))
+    return _S3_CLIENT
+
+# Parsed configs cached by (bucket, key) with the S3 ETag they came from.
+# Warm invocations only pay a cheap HeadObject to confirm the object is
+# unchanged instead of re-downloading and re-parsing the body.
+_CONFIG_CACHE = {}
+
+def load_user_config(bucket_name, user_id, etag=None):
+    """
+    Load user-specific search configuration from S3.
+
+    Callers that already know the object's current ETag (e.g. from a
+    bucket listing) can pass it so cache hits cost no S3 call at all.
+    """
     config_key = f"users/telegram_{user_id}.json"
-    
+    cached = _CONFIG_CACHE.get((bucket_name, config_key))
+    if cached and etag is not None and etag == cached[0]:
+        return cached[1]
+
+    s3 = _get_s3()
+
     try:
+        if cached and etag is None:
+            head = s3.head_object(Bucket=bucket_name, Key=config_key)
+            if head['ETag'] == cached[0]:
+                return cached[1]
+
         response = s3.get_object(Bucket=bucket_name, Key=config_key)
-        config_content = response['Body'].read().decode('utf-8')
-        return json.loads(config_content)
+        body = response['Body'].read()
+        # Configs may be uploaded gzip-compressed to cut transfer bytes;
+        # boto3 doesn't decompress them for us
+        if response.get('ContentEncoding') == 'gzip':
+            body = gzip.decompress(body)
+        config = _json_loads(body)
+        _CONFIG_CACHE[(bucket_name, config_key)] = (response['ETag'], config)
+        return config
     except s3.exceptions.NoSuchKey:
         return None
     except Exception as e:
         print(f"Error loading user config for {user_id}: {e}")
         return None
 
-def save_user_config(bucket_name, user_id, config):
-    """Save user-specific search configuration to S3"""
-    s3 = boto3.client('s3')
+def save_user_config(bucket_name, user_id, config, if_match=None):
+    """
+    Save user-specific search configuration to S3.
+
+    if_match makes the PUT conditional on the given ETag: if another
+    writer (the bot handling an /add or /toggle) updated the object
+    since our read, the write fails with 412 and is dropped rather than
+    clobbering their change; the stale cache entry is invalidated so
+    the next load re-reads the winning version.
+    """
+    s3 = _get_s3()
     config_key = f"users/telegram_{user_id}.json"
-    
+
     try:
-        config_content = json.dumps(config, indent=2)
-        s3.put_object(
-            Bucket=bucket_name,
-            Key=config_key,
-            Body=config_content.encode('utf-8'),
-            ContentType='application/json'
+        # Routing metadata added at load time (e.g. _user_id) stays local.
+        # Compact output to match the bot's writer - these objects are
+        # only ever machine-read, and the state flush rewrites them often
+        config_content = _json_dumps(
+            {k: v for k, v in config.items() if not k.startswith('_')}
         )
+        put_kwargs = {
+            'Bucket': bucket_name,
+            'Key': config_key,
+            'Body': config_content.encode('utf-8'),
+            'ContentType': 'application/json',
+        }
+        if if_match:
+            put_kwargs['IfMatch'] = if_match
+        response = s3.put_object(**put_kwargs)
+        # Keep the ETag cache coherent with what we just wrote
+        _CONFIG_CACHE[(bucket_name, config_key)] = (response['ETag'], config)
         return True
+    except s3.exceptions.ClientError as e:
+        if e.response.get('Error', {}).get('Code') == 'PreconditionFailed':
+            _CONFIG_CACHE.pop((bucket_name, config_key), None)
+            print(f"Config for {user_id} changed since read; dropping stale write")
+            return False
+        print(f"Error saving user config for {user_id}: {e}")
+        return False
     except Exception as e:
         print(f"Error saving user config for {user_id}: {e}")
         return False
 
 def get_all_user_configs(bucket_name):
     """Get all user configurations for scheduled monitoring"""
-    s3 = boto3.client('s3')
+    s3 = _get_s3()
     user_configs = []
     
     try:
-        response = s3.list_objects_v2(Bucket=bucket_name, Prefix="users/telegram_")
-        
-        if 'Contents' not in response:
+        # Paginate the listing - a bare list_objects_v2 stops at 1000 keys
+        # and would silently drop newer users. Empty objects are skipped
+        # here so they never cost a GetObject.
+        paginator = s3.get_paginator('list_objects_v2')
+        listed_users = []
+        for page in paginator.paginate(Bucket=bucket_name, Prefix="users/telegram_"):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                if key.endswith('.json') and obj.get('Size', 0) > 0:
+                    user_id = key.removeprefix('users/telegram_').removesuffix('.json')
+                    listed_users.append((user_id, obj['ETag']))
+
+        if not listed_users:
             return []
-        
-        for obj in response['Contents']:
-            if obj['Key'].endswith('.json'):
-                user_id = obj['Key'].replace('users/telegram_', '').replace('.json', '')
-                config = load_user_config(bucket_name, user_id)
-                if config and config.get("searches"):
-                    # Add metadata for notification routing
-                    config['_user_id'] = user_id
-                    user_configs.append(config)
-        
+
+        # Fetch configs concurrently - each load is an independent S3
+        # round-trip, so M users cost roughly one RTT instead of M. The
+        # ETag from the listing lets unchanged users be served from the
+        # module cache with no S3 call at all.
+        with ThreadPoolExecutor(max_workers=min(len(listed_users), 16)) as executor:
+            configs = list(executor.map(
+                lambda entry: load_user_config(bucket_name, entry[0], etag=entry[1]),
+                listed_users
+            ))
+
+        for (user_id, _), config in zip(listed_users, configs):
+            if config and config.get("searches"):
+                # Add metadata for notification routing
+                config['_user_id'] = user_id
+                user_configs.append(config)
+
         return user_configs
     except Exception as e:
         print(f"Error loading all user configs: {e}")
@@ -92,9 +275,12 @@ def format_campsite_availability_message(camping_output, has_availabilities, sea
     """
     Format camping availability results into a nice notification message
     """
-    SUCCESS_EMOJI = "🏕"
-    FAILURE_EMOJI = "❌"
-    
+    # Cheapest gate first: skip all string scanning when there is nothing
+    # to notify about. The error probe below only matters for outputs that
+    # claim availability.
+    if not has_availabilities:
+        return None, None, 0  # Don't notify for no availability
+
     if "Something went wrong" in camping_output:
         title = "🚨 Campbot Error"
         if search_name:
@@ -102,26 +288,17 @@ def format_campsite_availability_message(camping_output, has_availabilities, sea
         else:
             message = "🚨 Campbot is broken! Please help :'("
         return message, title, 1
-    
-    if not has_availabilities:
-        return None, None, 0  # Don't notify for no availability
-    
-    # Parse the camping output to extract available sites
-    lines = camping_output.strip().split('\n')
-    first_line = lines[0] if lines else "Campsites found!"
-    
-    available_site_strings = []
-    for line in lines:
-        if SUCCESS_EMOJI in line and ":" in line:
-            # Extract park name and availability count
-            parts = line.split(":")
-            if len(parts) >= 2:
-                park_part = parts[0].replace(SUCCESS_EMOJI, "").strip()
-                available_part = parts[1].strip()
-                available_count = available_part.split(" ")[0]
-                park_name = park_part.split("(")[0].strip()
-                available_site_strings.append(f"{available_count} site(s) available in {park_name}")
-    
+
+    # Parse the camping output to extract available sites - single regex
+    # pass instead of a per-line split/strip/replace chain
+    stripped_output = camping_output.strip()
+    first_line = stripped_output.split('\n', 1)[0] if stripped_output else "Campsites found!"
+
+    available_site_strings = [
+        f"{count} site(s) available in {park_name.strip()}"
+        for park_name, count in _AVAILABILITY_LINE_RE.findall(stripped_output)
+    ]
+
     if available_site_strings:
         # Create an exciting notification message
         if search_name:
@@ -147,27 +324,70 @@ def format_campsite_availability_message(camping_output, has_availabilities, sea
     
     return None, None, 0  # Don't notify if no specific availability found
 
+def build_notification(result):
+    """
+    Build the availability notification straight from the structured
+    per-park data collected by process_search - same message shape as
+    format_campsite_availability_message, minus the text parsing.
+    """
+    available_parks = [
+        park for park in result.get('availability_summary', [])
+        if park['current']
+    ]
+    if not available_parks:
+        return None, None, 0
+
+    search_name = result.get('search_name')
+    first_line = f"there are campsites available from {result.get('date_range', 'your dates')}!!!"
+
+    if search_name:
+        message = f"🎉 FOUND: {search_name}\n\n{first_line} 🏕🏕🏕\n\n"
+    else:
+        message = f"🎉 {first_line} 🏕🏕🏕\n\n"
+
+    message += "\n".join(
+        f"{park['current']} site(s) available in {park['park_name']}"
+        for park in available_parks
+    )
+
+    # Add booking links for each park
+    park_ids = result.get('parks')
+    if park_ids:
+        message += "\n\n📅 Book now:\n"
+        for park_id in park_ids:
+            message += f"https://www.recreation.gov/camping/campgrounds/{park_id}\n"
+    else:
+        message += f"\n\n🏕 Book now! 🏕"
+
+    title = f"🏕 {search_name.upper()}" if search_name else f"🏕 CAMPSITES FOUND!"
+
+    return message, title, 1  # High priority for availability
+
 def extract_site_count_from_output(camping_output):
     """Extract the total number of available sites from camping output"""
     if not camping_output:
         return 0
-    
-    total_sites = 0
-    SUCCESS_EMOJI = "🏕"
-    
-    lines = camping_output.strip().split('\n')
-    for line in lines:
-        if SUCCESS_EMOJI in line and ":" in line:
-            # Extract availability count from lines like "🏕 Park Name: 3 sites available"
-            parts = line.split(":")
-            if len(parts) >= 2:
-                available_part = parts[1].strip()
-                # Extract number from strings like "3 sites available" or "3 site(s) available"
-                match = re.search(r'(\d+)\s+site', available_part, re.IGNORECASE)
-                if match:
-                    total_sites += int(match.group(1))
-    
-    return total_sites
+
+    # Sum counts from lines like "🏕 Park Name: 3 site(s) available" in a
+    # single pass with the precompiled pattern
+    return sum(
+        int(count) for _, count in _AVAILABILITY_LINE_RE.findall(camping_output)
+    )
+
+# One timestamp shared by every last_checked stamp written in a single
+# run - the states are semantically "as of this cycle", so there is no
+# reason to pay a clock read and datetime allocation per search
+_RUN_TIMESTAMP = None
+
+def _refresh_run_timestamp():
+    """Start a fresh shared timestamp; handlers call this once per run"""
+    global _RUN_TIMESTAMP
+    _RUN_TIMESTAMP = datetime.now().isoformat()
+    return _RUN_TIMESTAMP
+
+def _run_now_iso():
+    """The current run's timestamp, computed on demand outside a run"""
+    return _RUN_TIMESTAMP or datetime.now().isoformat()
 
 def should_notify_availability_change(result, last_state):
     """
@@ -176,15 +396,22 @@ def should_notify_availability_change(result, last_state):
     """
     current_has_sites = result.get('has_availabilities', False)
     current_count = 0
-    
+
     if current_has_sites:
-        current_count = extract_site_count_from_output(result.get('camping_output', ''))
+        # process_search already collected per-park counts in structured
+        # form - summing those avoids a second regex pass over the same
+        # camping_output that build_notification stopped parsing too
+        summary = result.get('availability_summary')
+        if summary is not None:
+            current_count = sum(park['current'] for park in summary)
+        else:
+            current_count = extract_site_count_from_output(result.get('camping_output', ''))
     
     # Create current state
     current_state = {
         'has_sites': current_has_sites,
         'site_count': current_count,
-        'last_checked': datetime.now().isoformat()
+        'last_checked': _run_now_iso()
     }
     
     # If no previous state, notify if we have availability
@@ -217,47 +444,142 @@ def should_notify_availability_change(result, last_state):
     # Case 4: No availability in either state
     return False, "no_availability", current_state
 
-def update_search_availability_state(bucket_name, user_id, search_name, new_state):
-    """Update the availability state for a specific search"""
-    config = load_user_config(bucket_name, user_id)
+# Configs whose search state changed during the current run. A user with
+# K searches used to pay one PutObject per state change; deferred entries
+# are flushed as a single write per user at the end of the run instead.
+_DIRTY_CONFIGS = {}
+
+def update_search_availability_state(bucket_name, user_id, search_name,
+                                     new_state, config=None,
+                                     defer_save=False):
+    """
+    Update the availability state for a specific search.
+
+    The notification path already holds the user's config, so it passes
+    it in and skips the redundant S3 re-load; direct callers without one
+    still fall back to loading it. With defer_save=True the write is
+    queued for _flush_dirty_configs instead of hitting S3 immediately.
+    """
+    if config is None:
+        config = load_user_config(bucket_name, user_id)
     if not config:
         return False
-    
+
     # Find the search and update its state
     for search in config.get('searches', []):
         if search['name'] == search_name:
             search['last_availability_state'] = new_state
             break
-    
+
+    if defer_save:
+        _DIRTY_CONFIGS[str(user_id)] = (bucket_name, config)
+        return True
+
     return save_user_config(bucket_name, user_id, config)
 
+def _flush_dirty_configs():
+    """
+    Write every state-dirty config back to S3, one PutObject per user.
+
+    Each write is conditioned on the ETag we read at the start of the
+    run: if the bot persisted an /add or /toggle for that user mid-run,
+    the flush gets a 412 and drops our stale snapshot instead of
+    silently reverting their change. The lost state stamp is rewritten
+    on the next cycle anyway.
+    """
+    if not _DIRTY_CONFIGS:
+        return 0
+
+    dirty = list(_DIRTY_CONFIGS.items())
+    _DIRTY_CONFIGS.clear()
+
+    def _flush_one(entry):
+        user_id, (bucket_name, config) = entry
+        cached = _CONFIG_CACHE.get(
+            (bucket_name, f"users/telegram_{user_id}.json")
+        )
+        return save_user_config(
+            bucket_name, user_id, config,
+            if_match=cached[0] if cached else None
+        )
+
+    # Independent PUTs, same fan-out pattern as the config reads
+    with ThreadPoolExecutor(max_workers=min(len(dirty), 8)) as executor:
+        saved = list(executor.map(_flush_one, dirty))
+    return sum(1 for ok in saved if ok)
+
+# check_park results memoized for the duration of one handler run - two
+# searches (possibly from different users) targeting the same park and
+# window collapse to a single recreation.gov fetch. Cleared by the
+# handlers before each run so results never go stale across invocations.
+_CHECK_PARK_CACHE = {}
+
+def _check_park_cached(park_id, start_date, end_date, campsite_type,
+                       campsite_ids, nights, weekends_only):
+    """Memoizing wrapper around check_park keyed on the full request tuple"""
+    key = (
+        park_id, start_date, end_date, campsite_type,
+        tuple(campsite_ids or ()), nights, weekends_only
+    )
+    result = _CHECK_PARK_CACHE.get(key)
+    if result is None:
+        # Concurrent searches may race here and fetch twice; harmless
+        result = check_park(
+            park_id,
+            start_date,
+            end_date,
+            campsite_type,
+            campsite_ids,
+            nights=nights,
+            weekends_only=weekends_only,
+            excluded_site_ids=[]
+        )
+        _CHECK_PARK_CACHE[key] = result
+    return result
+
 def process_search(search_config):
-    """Process a single search configuration"""
-    if not search_config.get('enabled', True):
-        return None
-    
+    """Process a single search configuration (callers filter for enabled)"""
     try:
         parks = search_config['parks']
-        start_date = datetime.strptime(search_config['start_date'], '%Y-%m-%d')
-        end_date = datetime.strptime(search_config['end_date'], '%Y-%m-%d')
+        # fromisoformat is a C fast path for these YYYY-MM-DD strings,
+        # far cheaper than strptime's per-call format handling
+        start_date = datetime.fromisoformat(search_config['start_date'])
+        end_date = datetime.fromisoformat(search_config['end_date'])
         search_name = search_config.get('name', 'Unnamed Search')
         
         print(f"Processing search: {search_name}")
         
-        # Check each park
+        # Look the optional settings up once instead of once per park
+        campsite_type = search_config.get('campsite_type')
+        campsite_ids = search_config.get('campsite_ids', ())
+        nights = search_config.get('nights')
+        weekends_only = search_config.get('weekends_only', False)
+
+        # Check all parks concurrently - each check_park call is a blocking
+        # HTTPS round-trip to recreation.gov, so fan out instead of paying
+        # one network latency per park in sequence. A search with no parks
+        # would blow up the executor (max_workers must be > 0), so skip
+        # the fan-out and fall through to the benign "nothing available"
+        # output, matching the old serial loop.
         info_by_park_id = {}
-        for park_id in parks:
-            current, maximum, availabilities_filtered, park_name = check_park(
-                park_id,
-                start_date,
-                end_date,
-                search_config.get('campsite_type'),
-                search_config.get('campsite_ids', ()),
-                nights=search_config.get('nights'),
-                weekends_only=search_config.get('weekends_only', False),
-                excluded_site_ids=[]
-            )
-            info_by_park_id[park_id] = (current, maximum, availabilities_filtered, park_name)
+        if parks:
+            with ThreadPoolExecutor(max_workers=min(len(parks), 8)) as executor:
+                futures = {
+                    park_id: executor.submit(
+                        _check_park_cached,
+                        park_id,
+                        start_date,
+                        end_date,
+                        campsite_type,
+                        campsite_ids,
+                        nights,
+                        weekends_only
+                    )
+                    for park_id in parks
+                }
+                info_by_park_id = {
+                    park_id: future.result() for park_id, future in futures.items()
+                }
         
         # Generate human-readable output
         camping_output, has_availabilities = generate_human_output(
@@ -266,11 +588,24 @@ def process_search(search_config):
             end_date,
             gen_campsite_info=True
         )
-        
+
+        # Structured per-park counts for the notification path, so it never
+        # has to re-parse the human-readable text above
+        availability_summary = [
+            {
+                'park_id': park_id,
+                'park_name': park_name,
+                'current': current,
+                'maximum': maximum
+            }
+            for park_id, (current, maximum, _, park_name) in info_by_park_id.items()
+        ]
+
         return {
             'search_name': search_name,
             'camping_output': camping_output,
             'has_availabilities': has_availabilities,
+            'availability_summary': availability_summary,
             'parks': parks,
             'date_range': f"{search_config['start_date']} to {search_config['end_date']}",
             'priority': search_config.get('priority', 'normal')
@@ -283,55 +618,65 @@ def process_search(search_config):
             'has_availabilities': False
         }
 
-def notify_user(result, user_config, bucket_name=None):
-    """Send notifications to a user via their preferred channels with state-based change detection"""
-    notifications_sent = 0
-    
+def prepare_user_notification(result, user_config, bucket_name=None):
+    """
+    Build the Telegram message for a search result, or return None if no
+    notification is due. Handles error filtering and availability state
+    updates; actually sending is left to the caller so several results for
+    the same user can be batched into one message.
+    """
     # Check for errors - only notify for important ones (not transient API issues)
     if result.get('error'):
         if _should_notify_error(result.get('error')):
-            return _send_error_notification(result, user_config)
+            return f"<b>Search Error</b>\n\n🚨 Error checking '{result['search_name']}': {result['error']}"
         else:
             # Transient error (429, timeout, etc.) - log but don't notify
             print(f"⚠️ Transient error for '{result.get('search_name')}': {result.get('error')} (not notifying user)")
-            return 0
-    
+            return None
+
     # For availability notifications, use state-based change detection
     if not result.get('has_availabilities'):
         # No availability - just update state without notifying
         if bucket_name:
             _update_search_state_if_needed(result, user_config, bucket_name)
-        return 0
-    
+        return None
+
     # Check if we should notify based on state changes
     search_name = result.get('search_name', 'Unknown')
     last_state = _get_search_last_state(result, user_config)
-    
+
     should_notify, reason, new_state = should_notify_availability_change(result, last_state)
-    
+
     # Update the state regardless of notification decision
     if bucket_name:
         user_id = user_config.get('_user_id')
         if user_id:
-            update_search_availability_state(bucket_name, user_id, search_name, new_state)
+            update_search_availability_state(
+                bucket_name, user_id, search_name, new_state,
+                config=user_config, defer_save=True
+            )
             print(f"🔄 Updated availability state for '{search_name}': {reason}")
-    
+
     if not should_notify:
         print(f"🔇 Skipping notification for '{search_name}': {reason}")
-        return 0
-    
+        return None
+
     # Proceed with notification - enhance message with reason
     try:
-        message, title, priority = format_campsite_availability_message(
-            result['camping_output'],
-            result['has_availabilities'],
-            result['search_name'],
-            result.get('parks')
-        )
-        
+        if 'availability_summary' in result:
+            message, title, priority = build_notification(result)
+        else:
+            # Fallback for results without structured park data
+            message, title, priority = format_campsite_availability_message(
+                result['camping_output'],
+                result['has_availabilities'],
+                result['search_name'],
+                result.get('parks')
+            )
+
         if not message:  # No message to send
-            return 0
-            
+            return None
+
         # Enhance message based on the reason for notification
         if reason == "first_availability_found":
             message = f"🎉 NEW: First availability found!\n\n{message}"
@@ -340,100 +685,65 @@ def notify_user(result, user_config, bucket_name=None):
         elif reason == "significant_increase":
             site_count = new_state.get('site_count', 0)
             message = f"📈 MORE SITES: Now {site_count} sites available!\n\n{message}"
-        
-        # Adjust priority based on search config
-        if result.get('priority') == 'high':
-            priority = max(priority, 1)
-        
-        notification_settings = user_config.get('notification_settings', {})
-        
-        # Send Telegram notification if enabled
-        if notification_settings.get('telegram_enabled', True):
-            user_id = user_config.get('_user_id')
-            if user_id:
-                try:
-                    bot_token = os.environ.get('TELEGRAM_BOT_TOKEN')
-                    if bot_token:
-                        if title and title != "Campsite Alert":
-                            formatted_message = f"<b>{title}</b>\n\n{message}"
-                        else:
-                            formatted_message = message
-                        
-                        telegram_result = send_telegram_notification(bot_token, user_id, formatted_message)
-                    if telegram_result and telegram_result.get('ok'):
-                        notifications_sent += 1
-                        result['telegram_notification_sent'] = True
-                        result['notification_reason'] = reason
-                        print(f"✅ Sent notification to user {user_id}: {reason}")
-                except Exception as telegram_error:
-                    print(f"❌ Failed to send Telegram notification to user {user_id}: {telegram_error}")
-                    result['telegram_notification_error'] = str(telegram_error)
-        
-        return notifications_sent
-        
+
+        result['notification_reason'] = reason
+
+        if title and title != "Campsite Alert":
+            return f"<b>{title}</b>\n\n{message}"
+        return message
+
     except Exception as notification_error:
-        print(f"❌ Error in notify_user: {notification_error}")
+        print(f"❌ Error preparing notification: {notification_error}")
         result['notification_error'] = str(notification_error)
+        return None
+
+def deliver_user_notification(user_config, message):
+    """Send one prepared Telegram message to a user. Returns True on success."""
+    notification_settings = user_config.get('notification_settings', {})
+
+    if not notification_settings.get('telegram_enabled', True):
+        return False
+
+    user_id = user_config.get('_user_id')
+    if not user_id:
+        return False
+
+    try:
+        bot_token = _TELEGRAM_BOT_TOKEN
+        if not bot_token:
+            return False
+
+        telegram_result = send_telegram_notification(bot_token, user_id, message)
+        if telegram_result and telegram_result.get('ok'):
+            print(f"✅ Sent notification to user {user_id}")
+            return True
+    except Exception as telegram_error:
+        print(f"❌ Failed to send Telegram notification to user {user_id}: {telegram_error}")
+
+    return False
+
+def notify_user(result, user_config, bucket_name=None):
+    """Send notifications to a user via their preferred channels with state-based change detection"""
+    message = prepare_user_notification(result, user_config, bucket_name)
+    # Single-result path: flush any state change right away rather than
+    # relying on a handler-level flush
+    _flush_dirty_configs()
+    if not message:
         return 0
 
+    if deliver_user_notification(user_config, message):
+        result['telegram_notification_sent'] = True
+        return 1
+    return 0
+
 def _should_notify_error(error_message):
     """
     Determine if an error should trigger a user notification.
     Returns False for transient errors (rate limiting, timeouts).
     Returns True for important errors (config issues, persistent failures).
     """
-    error_lower = str(error_message).lower()
-    
-    # Transient errors that shouldn't notify users
-    transient_indicators = [
-        '429',  # Rate limiting
-        'rate limit',
-        'too many requests',
-        'timeout',
-        'timed out',
-        'connection',
-        'network',
-        'temporarily unavailable',
-        'service unavailable',
-        '503',  # Service unavailable
-        '502',  # Bad gateway
-        '504',  # Gateway timeout
-    ]
-    
-    for indicator in transient_indicators:
-        if indicator in error_lower:
-            return False
-    
     # All other errors should notify (config issues, invalid park IDs, etc.)
-    return True
-
-def _send_error_notification(result, user_config):
-    """Send error notifications immediately (no state checking needed)"""
-    message = f"🚨 Error checking '{result['search_name']}': {result['error']}"
-    title = "Search Error"
-    priority = 1
-    notifications_sent = 0
-    
-    notification_settings = user_config.get('notification_settings', {})
-    
-    # Send Telegram notification if enabled
-    if notification_settings.get('telegram_enabled', True):
-        user_id = user_config.get('_user_id')
-        if user_id:
-            try:
-                bot_token = os.environ.get('TELEGRAM_BOT_TOKEN')
-                if bot_token:
-                    formatted_message = f"<b>{title}</b>\n\n{message}"
-                    telegram_result = send_telegram_notification(bot_token, user_id, formatted_message)
-                if telegram_result and telegram_result.get('ok'):
-                    notifications_sent += 1
-                    result['telegram_notification_sent'] = True
-                    print(f"✅ Sent error notification to user {user_id}")
-            except Exception as telegram_error:
-                print(f"❌ Failed to send Telegram error notification to user {user_id}: {telegram_error}")
-                result['telegram_notification_error'] = str(telegram_error)
-    
-    return notifications_sent
+    return _TRANSIENT_ERROR_RE.search(str(error_message)) is None
 
 def _get_search_last_state(result, user_config):
     """Get the last availability state for a search"""
@@ -454,14 +764,17 @@ def _update_search_state_if_needed(result, user_config, bucket_name):
     new_state = {
         'has_sites': False,
         'site_count': 0,
-        'last_checked': datetime.now().isoformat()
+        'last_checked': _run_now_iso()
     }
     
     # Only update if state actually changed
     if not last_state or last_state.get('has_sites', False):
         user_id = user_config.get('_user_id')
         if user_id:
-            update_search_availability_state(bucket_name, user_id, search_name, new_state)
+            update_search_availability_state(
+                bucket_name, user_id, search_name, new_state,
+                config=user_config, defer_save=True
+            )
             print(f"🔄 Updated state for '{search_name}': availability_disappeared")
 
 def sanitize_for_telegram(text):
@@ -473,8 +786,7 @@ def sanitize_for_telegram(text):
     text = str(text)
     
     # Remove HTML tags that might conflict
-    import re
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub('', text)
     
     # Replace problematic characters
     text = text.replace('&', '&amp;')
@@ -487,46 +799,69 @@ def sanitize_for_telegram(text):
     
     return text
 
+def _post_telegram(url, data):
+    """
+    POST to the Telegram API, preferring the pooled keep-alive session.
+
+    Telegram only returns 2xx when the call succeeded ({"ok": true}), so
+    the success path skips decoding and parsing the response body; both
+    transports raise on error statuses, which callers handle.
+    """
+    if _HTTP_SESSION is not None:
+        response = _HTTP_SESSION.post(url, data=data, timeout=_HTTP_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        return {"ok": True}
+
+    encoded_data = urllib.parse.urlencode(data).encode()
+    req = urllib.request.Request(url, data=encoded_data)
+
+    # urlopen raises on non-2xx, so reaching the return means success
+    with urllib.request.urlopen(req, timeout=_HTTP_TIMEOUT_SECONDS):
+        return {"ok": True}
+
 def send_telegram_notification(bot_token, chat_id, message):
     """Send a message to Telegram"""
     try:
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        
+        if bot_token == _TELEGRAM_BOT_TOKEN and _TELEGRAM_SEND_URL:
+            url = _TELEGRAM_SEND_URL
+        else:
+            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+
         # First try with HTML parsing
         data = {
             'chat_id': chat_id,
             'text': message,
             'parse_mode': 'HTML'
         }
-        
-        encoded_data = urllib.parse.urlencode(data).encode()
-        req = urllib.request.Request(url, data=encoded_data)
-        
-        with urllib.request.urlopen(req) as response:
-            result = response.read().decode()
-            return json.loads(result)
-            
+
+        return _post_telegram(url, data)
+
     except Exception as e:
+        # Only a 400 (malformed HTML entities) is fixable by re-sending as
+        # plain text. Rate limits and server errors have already exhausted
+        # the session's backoff retries by the time they surface here -
+        # an immediate re-POST would just amplify load on the limiter.
+        status = getattr(getattr(e, 'response', None), 'status_code', None)
+        if status is None:
+            status = getattr(e, 'code', None)  # urllib.error.HTTPError
+        if status != 400:
+            print(f"Telegram send failed (status {status}): {e}")
+            return None
+
         print(f"HTML parsing failed: {e}")
-        
+
         # Fallback: try without any parsing
         try:
             # Strip all HTML tags and send as plain text
-            import re
-            plain_text = re.sub(r'<[^>]+>', '', message)
-            
+            plain_text = _TAG_RE.sub('', message)
+
             data = {
                 'chat_id': chat_id,
                 'text': plain_text
             }
-            
-            encoded_data = urllib.parse.urlencode(data).encode()
-            req = urllib.request.Request(url, data=encoded_data)
-            
-            with urllib.request.urlopen(req) as response:
-                result = response.read().decode()
-                return json.loads(result)
-                
+
+            return _post_telegram(url, data)
+
         except Exception as fallback_error:
             print(f"Failed to send Telegram message (both HTML and plain): {fallback_error}")
             return None
@@ -537,7 +872,7 @@ def handle_manual_check(event, context):
         user_id = event.get('user_id')
         chat_id = event.get('telegram_chat_id')
         bot_token = event.get('telegram_bot_token')
-        bucket_name = os.environ.get('CONFIG_BUCKET')
+        bucket_name = _CONFIG_BUCKET
         
         print(f"🔍 Manual check for user {user_id}, chat {chat_id}")
         
@@ -547,18 +882,22 @@ def handle_manual_check(event, context):
                 send_telegram_notification(bot_token, chat_id, error_msg)
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": error_msg})
+                "body": _json_dumps({"error": error_msg})
             }
         
-        # Load user configuration
-        user_config = load_user_config(bucket_name, user_id)
+        # Load user configuration - the bot handler already read it to
+        # count enabled searches, so accept its copy in the payload and
+        # skip a second GetObject for the same key
+        user_config = event.get('prefetched_config')
+        if not user_config:
+            user_config = load_user_config(bucket_name, user_id)
         if not user_config:
             error_msg = "❌ No searches found for your account"
             if bot_token and chat_id:
                 send_telegram_notification(bot_token, chat_id, error_msg)
             return {
                 "statusCode": 404,
-                "body": json.dumps({"error": "No searches found"})
+                "body": _json_dumps({"error": "No searches found"})
             }
         
         # Extract searches from user config
@@ -569,7 +908,7 @@ def handle_manual_check(event, context):
                 send_telegram_notification(bot_token, chat_id, error_msg)
             return {
                 "statusCode": 404,
-                "body": json.dumps({"error": "No searches configured"})
+                "body": _json_dumps({"error": "No searches configured"})
             }
         
         # Filter enabled searches
@@ -580,69 +919,75 @@ def handle_manual_check(event, context):
                 send_telegram_notification(bot_token, chat_id, error_msg)
             return {
                 "statusCode": 404,
-                "body": json.dumps({"error": "No enabled searches"})
+                "body": _json_dumps({"error": "No enabled searches"})
             }
         
         print(f"🔍 Processing {len(enabled_searches)} enabled searches for user {user_id}")
-        
-        # Process each search
-        results = []
-        availabilities_found = 0
-        
-        for search_config in enabled_searches:
+
+        # Fresh availability data for this run
+        _CHECK_PARK_CACHE.clear()
+        _refresh_run_timestamp()
+
+        # Check every enabled search concurrently - same fan-out as the
+        # scheduled loop, so a manual /check with several searches costs
+        # roughly one search's latency instead of their sum
+        def _run_search(search_config):
             try:
-                search_name = search_config.get('name', 'Unnamed Search')
-                print(f"🔍 Checking search: {search_name}")
-                
-                result = process_search(search_config)
-                
-                # Send immediate notification if availability found
-                if result.get('has_availabilities') and bot_token and chat_id:
-                    availabilities_found += 1
-                    
-                    # Sanitize the camping output for safe Telegram sending
-                    safe_output = sanitize_for_telegram(result.get('camping_output', 'Availability found but no details available'))
-                    
-                    # Build message with booking links
-                    message = f"🎉 <b>FOUND: {search_name}</b>\n\n{safe_output}\n\n"
-                    
-                    # Add booking links for each park
-                    park_ids = result.get('parks', [])
-                    if park_ids:
-                        message += "📅 <b>Book now:</b>\n"
-                        for park_id in park_ids:
-                            message += f"https://www.recreation.gov/camping/campgrounds/{park_id}\n"
-                    else:
-                        message += "🏕 Book now! 🏕"
-                    
-                    print(f"🔍 DEBUG: Sending message with length: {len(message)}")
-                    print(f"🔍 DEBUG: First 200 chars: {message[:200]}...")
-                    
-                    send_telegram_notification(bot_token, chat_id, message)
-                    print(f"✅ Sent availability notification for {search_name}")
-                elif result.get('error') and bot_token and chat_id:
-                    # Only notify for important errors (not transient API issues)
-                    if _should_notify_error(result['error']):
-                        error_message = f"⚠️ <b>Error in search: {search_name}</b>\n\n{result['error']}\n\nPlease check your search criteria."
-                        send_telegram_notification(bot_token, chat_id, error_message)
-                        print(f"❌ Sent error notification for {search_name}")
-                    else:
-                        print(f"⚠️ Transient error for {search_name} (not notifying): {result['error']}")
-                
-                results.append(result)
-                
+                print(f"🔍 Checking search: {search_config.get('name', 'Unnamed Search')}")
+                return process_search(search_config)
             except Exception as search_error:
                 print(f"❌ Error processing search {search_config.get('name', 'Unknown')}: {search_error}")
-                error_result = {
+                return {
                     'search_name': search_config.get('name', 'Unknown'),
                     'user_id': user_id,
                     'has_availabilities': False,
                     'error': str(search_error)
                 }
-                results.append(error_result)
+
+        with ThreadPoolExecutor(max_workers=min(len(enabled_searches), 8)) as executor:
+            results = list(executor.map(_run_search, enabled_searches))
+
+        # Send notifications after the gather, in config order, so the
+        # results read in the same order as /list
+        availabilities_found = 0
+        for search_config, result in zip(enabled_searches, results):
+            search_name = search_config.get('name', 'Unnamed Search')
+
+            # Send immediate notification if availability found
+            if result.get('has_availabilities') and bot_token and chat_id:
+                availabilities_found += 1
+
+                # Sanitize the camping output for safe Telegram sending
+                safe_output = sanitize_for_telegram(result.get('camping_output', 'Availability found but no details available'))
+
+                # Build message with booking links
+                message = f"🎉 <b>FOUND: {search_name}</b>\n\n{safe_output}\n\n"
+
+                # Add booking links for each park
+                park_ids = result.get('parks', [])
+                if park_ids:
+                    message += "📅 <b>Book now:</b>\n"
+                    for park_id in park_ids:
+                        message += f"https://www.recreation.gov/camping/campgrounds/{park_id}\n"
+                else:
+                    message += "🏕 Book now! 🏕"
+
+                print(f"🔍 DEBUG: Sending message with length: {len(message)}")
+                print(f"🔍 DEBUG: First 200 chars: {message[:200]}...")
+
+                send_telegram_notification(bot_token, chat_id, message)
+                print(f"✅ Sent availability notification for {search_name}")
+            elif result.get('error') and bot_token and chat_id:
+                # Only notify for important errors (not transient API issues)
+                if _should_notify_error(result['error']):
+                    error_message = f"⚠️ <b>Error in search: {search_name}</b>\n\n{result['error']}\n\nPlease check your search criteria."
+                    send_telegram_notification(bot_token, chat_id, error_message)
+                    print(f"❌ Sent error notification for {search_name}")
+                else:
+                    print(f"⚠️ Transient error for {search_name} (not notifying): {result['error']}")
         
         # Send summary message
-        errors = len([r for r in results if r.get('error')])
+        errors = sum(1 for r in results if r.get('error'))
         if availabilities_found > 0:
             summary = f"✅ <b>Manual Check Complete!</b>\n\n🎉 Found availability in {availabilities_found} of {len(enabled_searches)} searches!\n\nDetailed results were sent above. 🏕️"
         else:
@@ -656,7 +1001,7 @@ def handle_manual_check(event, context):
         
         return {
             "statusCode": 200,
-            "body": json.dumps({
+            "body": _json_dumps({
                 "message": "Manual check completed",
                 "availabilities_found": availabilities_found,
                 "total_searches": len(enabled_searches),
@@ -674,7 +1019,7 @@ def handle_manual_check(event, context):
         
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": str(e)})
+            "body": _json_dumps({"error": str(e)})
         }
 
 def campsite_checker_handler(event, context):
@@ -683,20 +1028,30 @@ def campsite_checker_handler(event, context):
     Supports both scheduled monitoring and manual check requests from Telegram bot
     """
     try:
+        # Warm-keeper ping (e.g. an EventBridge rule posting {"warm": true})
+        # - return before touching S3 or recreation.gov so the container
+        # stays hot at near-zero cost and real invocations skip cold starts
+        if event.get('source') == 'warmer' or event.get('warm') or event.get('warmup'):
+            # Prime the lazy S3 client too, so the first real invocation
+            # in this container skips construction and TLS setup as well
+            if _CONFIG_BUCKET:
+                _get_s3()
+            return {"statusCode": 200, "body": "warm"}
+
         # Check if this is a manual check request from Telegram bot
         if event.get('manual_check') and event.get('user_id'):
             print(f"🔍 Processing manual check request for user {event['user_id']}")
             return handle_manual_check(event, context)
         
         # Scheduled monitoring logic - multi-user mode
-        bucket_name = os.environ.get('CONFIG_BUCKET')
+        bucket_name = _CONFIG_BUCKET
         
         if not bucket_name:
             error_msg = "CONFIG_BUCKET environment variable not set"
             print(f"❌ {error_msg}")
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": error_msg})
+                "body": _json_dumps({"error": error_msg})
             }
         
         if not CAMPING_AVAILABLE:
@@ -704,7 +1059,7 @@ def campsite_checker_handler(event, context):
             print(f"❌ {error_msg}")
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": error_msg})
+                "body": _json_dumps({"error": error_msg})
             }
         
         results = []
@@ -719,7 +1074,7 @@ def campsite_checker_handler(event, context):
             print("No user configurations found")
             return {
                 "statusCode": 200,
-                "body": json.dumps({
+                "body": _json_dumps({
                     "message": "No users with active searches",
                     "total_searches": 0,
                     "availabilities_found": 0,
@@ -728,55 +1083,127 @@ def campsite_checker_handler(event, context):
                 })
             }
         
+        # Collect every enabled search across all users, then run them
+        # concurrently - each search is independent and dominated by
+        # recreation.gov I/O, so total wall time becomes max(search) instead
+        # of sum(searches).
+        # Fresh availability data for this run
+        _CHECK_PARK_CACHE.clear()
+        _DIRTY_CONFIGS.clear()
+        _refresh_run_timestamp()
+
+        pending_searches = []
         for user_config in user_configs:
             user_id = user_config.get('_user_id', 'unknown')
-            user_searches = user_config.get('searches', [])
-            print(f"Processing {len(user_searches)} searches for user {user_id}")
-            
-            for search_config in user_searches:
-                if not search_config.get('enabled', True):
-                    continue
-                
-                total_searches += 1
-                result = process_search(search_config)
-                if result:
-                    # Add user context to result
-                    result['user_id'] = user_id
-                    results.append(result)
-                    
-                    # Send notifications to this user
-                    user_notifications = notify_user(result, user_config, bucket_name)
-                    notifications_sent += user_notifications
+            enabled_searches = [
+                s for s in user_config.get('searches', [])
+                if s.get('enabled', True)
+            ]
+            print(f"Processing {len(enabled_searches)} searches for user {user_id}")
+            pending_searches.extend(
+                (user_config, search_config) for search_config in enabled_searches
+            )
+
+        total_searches = len(pending_searches)
+
+        search_results = []
+        if pending_searches:
+            with ThreadPoolExecutor(max_workers=min(len(pending_searches), 8)) as executor:
+                search_results = list(executor.map(
+                    process_search,
+                    [search_config for _, search_config in pending_searches]
+                ))
+
+        # Prepare messages sequentially (they update per-user state in S3),
+        # then deliver at most one Telegram message per user per run instead
+        # of one HTTPS round-trip per search result.
+        pending_by_user = {}
+        availabilities_found = 0
+        users_processed_set = set()
+        for (user_config, _), result in zip(pending_searches, search_results):
+            if result:
+                # Add user context to result
+                user_id = user_config.get('_user_id', 'unknown')
+                result['user_id'] = user_id
+                results.append(result)
+
+                # Track summary counters here rather than re-walking the
+                # (potentially large) results list afterwards
+                users_processed_set.add(user_id)
+                if result.get('has_availabilities'):
+                    availabilities_found += 1
+
+                message = prepare_user_notification(result, user_config, bucket_name)
+                if message:
+                    user_pending = pending_by_user.setdefault(
+                        user_id, (user_config, [])
+                    )
+                    user_pending[1].append((result, message))
+
+        # All state mutations happened during message preparation - write
+        # each changed config back exactly once
+        _flush_dirty_configs()
+
+        # Per-user deliveries are independent Telegram round-trips, so fan
+        # them out instead of paying one send latency per user in sequence
+        def _deliver(entry):
+            user_config, pending = entry
+            combined_message = "\n\n".join(message for _, message in pending)
+            return deliver_user_notification(user_config, combined_message), pending
+
+        if pending_by_user:
+            with ThreadPoolExecutor(max_workers=min(len(pending_by_user), 8)) as executor:
+                for delivered, pending in executor.map(_deliver, pending_by_user.values()):
+                    if delivered:
+                        notifications_sent += 1
+                        for result, _ in pending:
+                            result['telegram_notification_sent'] = True
         
         # Summary
-        availabilities_found = len([r for r in results if r.get('has_availabilities')])
-        users_processed = len(set(r.get('user_id') for r in results if r.get('user_id')))
+        users_processed = len(users_processed_set)
         
-        print(f"Processed {total_searches} searches across {users_processed} users, found availability in {availabilities_found}, sent {notifications_sent} notifications")
+        LOG.info(
+            "Processed %d searches across %d users, found availability in %d, sent %d notifications",
+            total_searches, users_processed, availabilities_found, notifications_sent
+        )
         
+        # The scheduled caller only needs the counters; serializing full
+        # results (with their large camping_output strings) into the
+        # response costs CPU and transfer, so ship a compact summary and
+        # include full results only when explicitly asked for.
+        response_body = {
+            "message": "Campsite monitoring completed",
+            "mode": "multi-user",
+            "total_searches": total_searches,
+            "availabilities_found": availabilities_found,
+            "notifications_sent": notifications_sent,
+            "users_processed": users_processed,
+            "results_summary": [
+                {
+                    "name": r.get('search_name'),
+                    "user_id": r.get('user_id'),
+                    "found": r.get('has_availabilities', False)
+                }
+                for r in results
+            ]
+        }
+        if event.get('verbose'):
+            response_body["results"] = results
+
         return {
             "statusCode": 200,
-            "body": json.dumps({
-                "message": "Campsite monitoring completed",
-                "mode": "multi-user",
-                "total_searches": total_searches,
-                "availabilities_found": availabilities_found,
-                "notifications_sent": notifications_sent,
-                "users_processed": users_processed,
-                "results": results
-            })
+            "body": _json_dumps(response_body)
         }
         
     except Exception as e:
         error_msg = f"Lambda execution failed: {str(e)}"
-        print(f"❌ {error_msg}")
-        
+        # .exception logs the traceback without a second str(e) pass
+        LOG.exception("Critical lambda failure")
+
+        # _json_dumps of the bare string handles the JSON escaping
         return {
             "statusCode": 500,
-            "body": json.dumps({
-                "error": error_msg,
-                "message": "Critical lambda failure"
-            })
+            "body": _ERROR_BODY_TEMPLATE % _json_dumps(error_msg)
         }
 
 # AWS Lambda entry point (keeps existing name for compatibility)
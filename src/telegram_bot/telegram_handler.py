@@ -5,11 +5,14 @@ Handles user interactions and manages per-user campsite search configurations.
 """
 
 import json
-import urllib.request
-import urllib.parse
+import logging
+import time
 import os
 import boto3
-from datetime import datetime, timedelta
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import date, datetime
 import re
 
 # Load environment variables when running locally
@@ -20,37 +23,134 @@ try:
 except ImportError:
     pass
 
+# orjson is a C extension several times faster than stdlib json - the bot
+# bundle ships without it today, so fall back quietly, but pick it up
+# automatically if the packaging ever adds it. Used on the hot paths:
+# webhook body parse and config load/save.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+# Debug chatter is gated behind the log level instead of unconditional
+# prints - every stdout line is a CloudWatch PutLogEvents on Lambda.
+# The level goes on the module logger, not basicConfig: the Lambda
+# runtime pre-installs a root handler, so basicConfig would be a no-op
+# there and LOG_LEVEL would never take effect.
+LOG = logging.getLogger(__name__)
+LOG.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+# Created lazily and reused across warm invocations - building a boto3
+# client re-parses service models and opens a fresh connection pool, which
+# every webhook was paying before
+_S3_CLIENT = None
+
+def _get_s3():
+    """Return the shared S3 client, creating it on first use"""
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        _S3_CLIENT = boto3.client('s3')
+    return _S3_CLIENT
+
+_LAMBDA_CLIENT = None
+
+def _get_lambda():
+    """Return the shared Lambda client, creating it on first use
+
+    tcp_keepalive keeps the connection to the Lambda API alive between
+    webhook events in the same warm container, so repeat /check commands
+    skip the TLS handshake.
+    """
+    global _LAMBDA_CLIENT
+    if _LAMBDA_CLIENT is None:
+        from botocore.config import Config
+        _LAMBDA_CLIENT = boto3.client('lambda', config=Config(
+            max_pool_connections=10,
+            tcp_keepalive=True,
+            retries={'max_attempts': 2, 'mode': 'standard'},
+        ))
+    return _LAMBDA_CLIENT
+
+# Pooled keep-alive connections to the Telegram API - a command handler
+# fires several sendMessage calls and was paying a fresh TCP+TLS handshake
+# for each one. urllib3 ships with boto3, so no extra packaging needed.
+# Timeouts keep a degraded Telegram endpoint from stalling the webhook.
+_HTTP = urllib3.PoolManager(
+    maxsize=10,
+    retries=urllib3.Retry(total=3, backoff_factor=0.2),
+    timeout=urllib3.Timeout(connect=3.0, read=10.0)
+)
+
 def send_telegram_notification(chat_id, text, bot_token, reply_markup=None):
     """Send a message via Telegram Bot API"""
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-    
+
     data = {
         "chat_id": chat_id,
         "text": text,
         "parse_mode": "Markdown"
     }
-    
+
+    # The Bot API takes JSON bodies directly - one serialize, no
+    # percent-encoding pass over the message text, and reply_markup stays
+    # a plain object instead of JSON nested inside form encoding
     if reply_markup:
-        data["reply_markup"] = json.dumps(reply_markup)
-    
-    data_encoded = urllib.parse.urlencode(data).encode()
-    
-    req = urllib.request.Request(url, data=data_encoded)
-    with urllib.request.urlopen(req) as response:
-        result = response.read().decode()
-    
-    return json.loads(result)
+        data["reply_markup"] = reply_markup
+
+    response = _HTTP.request(
+        'POST',
+        url,
+        body=_json_dumps(data),
+        headers={'Content-Type': 'application/json'}
+    )
+
+    return _json_loads(response.data)
+
+# Parsed configs cached per user for a short TTL - the same user typically
+# sends several commands within seconds, and each load was a full S3
+# GetObject + parse. save_user_config refreshes the entry so a user's own
+# writes are always visible to their next command.
+_USER_CACHE = {}
+_USER_CACHE_TTL_SECONDS = 60
+
+# ETag of the last version of each user's config we read or wrote - lets
+# save_user_config do a conditional PUT instead of a blind overwrite
+_USER_ETAGS = {}
+
+def load_user_config(bucket_name, user_id, _create_default=True):
+    """Load user-specific search configuration from S3
+
+    With _create_default=False a missing config returns None instead of
+    writing a fresh default back to S3 - batch readers want that, only
+    the interactive command path should create configs.
+    """
+    cached = _USER_CACHE.get(str(user_id))
+    if cached and time.monotonic() - cached[0] < _USER_CACHE_TTL_SECONDS:
+        return cached[1]
 
-def load_user_config(bucket_name, user_id):
-    """Load user-specific search configuration from S3"""
-    s3 = boto3.client('s3')
+    s3 = _get_s3()
     config_key = f"users/telegram_{user_id}.json"
-    
+
     try:
         response = s3.get_object(Bucket=bucket_name, Key=config_key)
-        config_content = response['Body'].read().decode('utf-8')
-        return json.loads(config_content)
+        # Both parsers take bytes directly - no intermediate decode
+        config = _json_loads(response['Body'].read())
+        _USER_CACHE[str(user_id)] = (time.monotonic(), config)
+        _USER_ETAGS[str(user_id)] = response.get('ETag')
+        return config
     except s3.exceptions.NoSuchKey:
+        if not _create_default:
+            return None
         # Create default config for new user
         default_config = {
             "version": "1.0",
@@ -69,64 +169,117 @@ def load_user_config(bucket_name, user_id):
         print(f"Error loading user config for {user_id}: {e}")
         return None
 
-def save_user_config(bucket_name, user_id, config):
-    """Save user-specific search configuration to S3"""
-    s3 = boto3.client('s3')
+def save_user_config(bucket_name, user_id, config, pretty=False):
+    """Save user-specific search configuration to S3
+
+    Configs are machine-read, so the default is compact separators -
+    roughly half the bytes of indent=2 on both the PUT and every GET.
+    Pass pretty=True when dumping a config for human inspection.
+    """
+    s3 = _get_s3()
     config_key = f"users/telegram_{user_id}.json"
-    
+
     try:
-        config_content = json.dumps(config, indent=2)
-        s3.put_object(
-            Bucket=bucket_name,
-            Key=config_key,
-            Body=config_content.encode('utf-8'),
-            ContentType='application/json'
-        )
+        if pretty:
+            config_content = json.dumps(config, indent=2)
+        else:
+            config_content = _json_dumps(config)
+        put_kwargs = {
+            'Bucket': bucket_name,
+            'Key': config_key,
+            'Body': config_content,
+            'ContentType': 'application/json; charset=utf-8',
+        }
+        # Conditional PUT: only overwrite the version we read. If two
+        # webhooks race (user taps a button twice), the loser gets a 412
+        # instead of silently clobbering the winner's write.
+        etag = _USER_ETAGS.get(str(user_id))
+        if etag:
+            put_kwargs['IfMatch'] = etag
+        response = s3.put_object(**put_kwargs)
+        # Keep the per-user cache and ETag in step with what was written
+        _USER_CACHE[str(user_id)] = (time.monotonic(), config)
+        _USER_ETAGS[str(user_id)] = response.get('ETag')
         return True
+    except s3.exceptions.ClientError as e:
+        if e.response.get('Error', {}).get('Code') == 'PreconditionFailed':
+            # Someone else wrote since our read - drop the stale cache so
+            # the next load sees their version, and surface the failure
+            # (re-putting our copy would reinstate the clobber)
+            _USER_CACHE.pop(str(user_id), None)
+            _USER_ETAGS.pop(str(user_id), None)
+            print(f"Conflicting write for user {user_id}, not overwriting")
+            return False
+        print(f"Error saving user config for {user_id}: {e}")
+        return False
     except Exception as e:
         print(f"Error saving user config for {user_id}: {e}")
         return False
 
 def get_all_user_configs(bucket_name):
     """Get all user configurations for scheduled monitoring"""
-    s3 = boto3.client('s3')
+    s3 = _get_s3()
     user_configs = []
     
     try:
-        response = s3.list_objects_v2(Bucket=bucket_name, Prefix="users/telegram_")
-        
-        if 'Contents' not in response:
+        # Paginate - a single list_objects_v2 call stops at 1000 keys and
+        # would silently drop users past that
+        paginator = s3.get_paginator('list_objects_v2')
+        user_ids = []
+        for page in paginator.paginate(Bucket=bucket_name, Prefix="users/telegram_"):
+            for obj in page.get('Contents', []):
+                if obj['Key'].endswith('.json'):
+                    user_ids.append(
+                        obj['Key'].replace('users/telegram_', '').replace('.json', '')
+                    )
+
+        if not user_ids:
             return []
-        
-        for obj in response['Contents']:
-            if obj['Key'].endswith('.json'):
-                user_id = obj['Key'].replace('users/telegram_', '').replace('.json', '')
-                config = load_user_config(bucket_name, user_id)
-                if config:
-                    user_configs.append(config)
-        
+
+        # Load configs concurrently - each one is an independent S3
+        # round-trip and the shared client is thread-safe
+        with ThreadPoolExecutor(max_workers=min(len(user_ids), 16)) as executor:
+            configs = list(executor.map(
+                lambda user_id: load_user_config(
+                    bucket_name, user_id, _create_default=False
+                ),
+                user_ids
+            ))
+
+        user_configs = [config for config in configs if config]
+
         return user_configs
     except Exception as e:
         print(f"Error loading all user configs: {e}")
         return []
 
+# Patterns compiled once at module load instead of per message.
+# _ADD_QUOTED_RE handles both straight and curly quotes (iOS smart quotes)
+# around the search name.
+_PARK_URL_RE = re.compile(r'recreation\.gov/camping/campgrounds/(\d+)')
+_ADD_QUOTED_RE = re.compile(r'/add\s+["""]([^"""]+)[""]\s+(\S+)\s+(\S+)\s+(.+)')
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Pure function of its argument, and the same handful of popular park
+# strings come through repeatedly - memoize across warm invocations
+@lru_cache(maxsize=512)
 def parse_park_input(park_input):
     """Parse park input - accepts only park ID numbers or recreation.gov URLs"""
     # If it's a direct ID (all digits)
     if park_input.isdigit():
         return park_input
-    
+
     # If it's a recreation.gov URL
-    url_match = re.search(r'recreation\.gov/camping/campgrounds/(\d+)', park_input)
+    url_match = _PARK_URL_RE.search(park_input)
     if url_match:
         return url_match.group(1)
-    
+
     # Park names are not supported - only numeric IDs and URLs
     return None
 
-def handle_start_command(chat_id, bot_token):
-    """Handle /start command"""
-    welcome_message = """🏕️ *Welcome to Campsite Bot!*
+# Static reply text built once at import time - these are multi-hundred-byte
+# literals and the handlers were reconstructing them on every webhook
+_WELCOME_MSG = """🏕️ *Welcome to Campsite Bot!*
 
 I'll help you monitor recreation.gov campsites and notify you when sites become available.
 
@@ -145,22 +298,91 @@ I'll help you monitor recreation.gov campsites and notify you when sites become
 3. You'll get notified here when sites are found!
 
 Let's find you some campsites! 🎉"""
-    
-    return send_telegram_notification(chat_id, welcome_message, bot_token)
+
+_ADD_HELP_MSG = """📝 *Add New Search*
+
+Format: `/add "Search Name" start_date end_date park_id`
+
+*Examples:*
+• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
+• `/add "Christmas Camping" 2025-10-15 2025-10-17 232472`
+• `/add "Grand Canyon Camping" 2025-08-01 2025-08-03 232266`
+
+*Finding Park IDs:*
+• Visit recreation.gov and search for your campground
+• When you view campsites, check the URL - it will contain the park ID
+• Example: `recreation.gov/camping/campgrounds/232448` → Park ID is `232448`
+"""
+
+_ADD_NO_DATES_MSG = """❌ *Invalid Format*
+
+I couldn't find valid dates in your command.
+
+*Format:* `/add "Search Name" start_date end_date park_id`
+
+*Examples:*
+• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
+• `/add Jtree 2025-07-04 2025-07-06 232472`
+
+*Park ID required - find it in the recreation.gov campground URL*"""
+
+_ADD_ONE_DATE_MSG = """❌ *Invalid Format*
+
+I found only one date. Please provide both start and end dates.
+
+*Format:* `/add "Search Name" start_date end_date park_id`
+
+*Examples:*
+• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
+• `/add Jtree 2025-07-04 2025-07-06 232472`"""
+
+_ADD_NO_NAME_MSG = """❌ *Missing Search Name*
+
+Please provide a name for your search.
+
+*Format:* `/add "Search Name" start_date end_date park_id`"""
+
+_ADD_NO_PARK_MSG = """❌ *Missing Park Information*
+
+Please provide the park ID number.
+
+*Format:* `/add "Search Name" start_date end_date park_id`
+
+*Examples:*
+• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
+• `/add "Joshua Tree" 2025-10-15 2025-10-17 232472`
+
+*Find Park IDs:* Visit recreation.gov, search for your campground, and copy the ID from the URL."""
+
+_EMPTY_LIST_MSG = """📋 *Your Searches*
+
+You don't have any campsite searches yet!
+
+Use `/add` to create your first search and start monitoring campsites. 🏕️"""
+
+_UNKNOWN_COMMAND_MSG = """❓ *Unknown Command*
+
+*Available Commands:*
+• `/add` - Add a new campsite search
+• `/list` - Show your active searches
+• `/toggle <name>` - Enable/disable a search
+• `/delete <name>` - Remove a search
+• `/deleteall` - Remove all searches (reset)
+• `/check` - Manually check all your searches
+• `/help` - Show help message
+
+Type `/help` for more details!"""
+
+def handle_start_command(chat_id, bot_token):
+    """Handle /start command"""
+    return send_telegram_notification(chat_id, _WELCOME_MSG, bot_token)
 
 def handle_add_command(chat_id, message_text, bot_token, bucket_name, user_id):
     """Handle /add command with guided search creation"""
     # Format: /add "Search Name" YYYY-MM-DD YYYY-MM-DD park_id
     
-    # Better parsing to handle quoted search names
-    import re
-    
-    # Try to parse quoted search name first - handle both straight and curly quotes (iOS smart quotes)
-    # Straight quotes: "text" 
-    # Curly quotes: "text" (iOS default)
-    # Mixed quotes: "text" or "text" (possible edge cases)
-    quoted_pattern = r'/add\s+["""]([^"""]+)[""]\s+(\S+)\s+(\S+)\s+(.+)'
-    match = re.match(quoted_pattern, message_text)
+    # Try to parse quoted search name first (see _ADD_QUOTED_RE at module top)
+    match = _ADD_QUOTED_RE.match(message_text)
     
     if match:
         search_name = match.group(1)
@@ -175,25 +397,9 @@ def handle_add_command(chat_id, message_text, bot_token, bucket_name, user_id):
         # Smarter fallback parsing without quotes - look for date patterns
         parts = message_text.split()
         if len(parts) < 4:
-            help_message = """📝 *Add New Search*
-
-Format: `/add "Search Name" start_date end_date park_id`
-
-*Examples:*
-• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
-• `/add "Christmas Camping" 2025-10-15 2025-10-17 232472`
-• `/add "Grand Canyon Camping" 2025-08-01 2025-08-03 232266`
-
-*Finding Park IDs:*
-• Visit recreation.gov and search for your campground
-• When you view campsites, check the URL - it will contain the park ID
-• Example: `recreation.gov/camping/campgrounds/232448` → Park ID is `232448`
-"""
-            
-            return send_telegram_notification(chat_id, help_message, bot_token)
+            return send_telegram_notification(chat_id, _ADD_HELP_MSG, bot_token)
         
         # Look for date patterns to identify where search name ends
-        date_pattern = r'\d{4}-\d{2}-\d{2}'
         search_name = None
         start_date = None
         end_date = None
@@ -202,28 +408,16 @@ Format: `/add "Search Name" start_date end_date park_id`
         # Find the first date in the parts
         date_start_index = None
         for i, part in enumerate(parts[1:], 1):  # Skip '/add'
-            if re.match(date_pattern, part):
+            if _DATE_RE.match(part):
                 date_start_index = i
                 break
         
         if date_start_index is None or date_start_index + 1 >= len(parts):
             # No date found or not enough parts after first date
-            help_message = """❌ *Invalid Format*
-
-I couldn't find valid dates in your command. 
-
-*Format:* `/add "Search Name" start_date end_date park_id`
-
-*Examples:*
-• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
-• `/add Jtree 2025-07-04 2025-07-06 232472`
-
-*Park ID required - find it in the recreation.gov campground URL*"""
-            
-            return send_telegram_notification(chat_id, help_message, bot_token)
+            return send_telegram_notification(chat_id, _ADD_NO_DATES_MSG, bot_token)
         
         # Check if we have a second date
-        if date_start_index + 1 < len(parts) and re.match(date_pattern, parts[date_start_index + 1]):
+        if date_start_index + 1 < len(parts) and _DATE_RE.match(parts[date_start_index + 1]):
             # We have both dates
             search_name = ' '.join(parts[1:date_start_index])
             start_date = parts[date_start_index]
@@ -234,42 +428,14 @@ I couldn't find valid dates in your command.
                 park_input = None
         else:
             # Only one date found - malformed
-            help_message = """❌ *Invalid Format*
-
-I found only one date. Please provide both start and end dates.
-
-*Format:* `/add "Search Name" start_date end_date park_id`
-
-*Examples:*
-• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
-• `/add Jtree 2025-07-04 2025-07-06 232472`"""
-            
-            return send_telegram_notification(chat_id, help_message, bot_token)
+            return send_telegram_notification(chat_id, _ADD_ONE_DATE_MSG, bot_token)
         
         # Validate we have all required parts
         if not search_name or not search_name.strip():
-            help_message = """❌ *Missing Search Name*
-
-Please provide a name for your search.
+            return send_telegram_notification(chat_id, _ADD_NO_NAME_MSG, bot_token)
 
-*Format:* `/add "Search Name" start_date end_date park_id`"""
-            
-            return send_telegram_notification(chat_id, help_message, bot_token)
-            
         if not park_input or not park_input.strip():
-            help_message = """❌ *Missing Park Information*
-
-Please provide the park ID number.
-
-*Format:* `/add "Search Name" start_date end_date park_id`
-
-*Examples:*
-• `/add "Yosemite Trip" 2025-07-04 2025-07-06 232448`
-• `/add "Joshua Tree" 2025-10-15 2025-10-17 232472`
-
-*Find Park IDs:* Visit recreation.gov, search for your campground, and copy the ID from the URL."""
-            
-            return send_telegram_notification(chat_id, help_message, bot_token)
+            return send_telegram_notification(chat_id, _ADD_NO_PARK_MSG, bot_token)
         
         search_name = search_name.strip()
         park_input = park_input.strip()
@@ -279,15 +445,15 @@ Please provide the park ID number.
         search_name = search_name.strip('"').strip('\u201c').strip('\u201d')
         
     try:
-        # Validate dates
+        # Validate dates - fromisoformat is the C fast path for the exact
+        # YYYY-MM-DD format we accept, and plain dates need no time fields
         try:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+            start_dt = date.fromisoformat(start_date)
+            end_dt = date.fromisoformat(end_date)
             if start_dt >= end_dt:
                 raise ValueError("End date must be after start date")
             # Allow dates that are today or in the future (give some flexibility)
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            if start_dt < today:
+            if start_dt < date.today():
                 raise ValueError("Start date must be today or in the future")
         except ValueError as e:
             return send_telegram_notification(chat_id, f"❌ Invalid date: {str(e)}", bot_token)
@@ -352,6 +518,15 @@ Use `/list` to see all your searches."""
     except Exception as e:
         return send_telegram_notification(chat_id, f"❌ Error adding search: {str(e)}", bot_token)
 
+# Per-search block for /list, bound to str.format once at import time so
+# the loop below is a single format call per search
+_LIST_ENTRY_TMPL = """*{i}. {name}*
+{status}
+📅 {start_date} to {end_date}
+🏕️ Parks: {parks}
+🌙 Nights: {nights}
+""".format
+
 def handle_list_command(chat_id, bot_token, bucket_name, user_id):
     """Handle /list command"""
     config = load_user_config(bucket_name, user_id)
@@ -360,29 +535,25 @@ def handle_list_command(chat_id, bot_token, bucket_name, user_id):
     
     searches = config.get("searches", [])
     if not searches:
-        message = """📋 *Your Searches*
-
-You don't have any campsite searches yet!
-
-Use `/add` to create your first search and start monitoring campsites. 🏕️"""
-        return send_telegram_notification(chat_id, message, bot_token)
+        return send_telegram_notification(chat_id, _EMPTY_LIST_MSG, bot_token)
     
     message_parts = ["📋 *Your Searches*\n"]
-    
-    for i, search in enumerate(searches, 1):
-        status = "🟢 Enabled" if search.get("enabled", True) else "🔴 Disabled"
-        parks_text = ", ".join(search["parks"])
-        
-        search_text = f"""*{i}. {search["name"]}*
-{status}
-📅 {search["start_date"]} to {search["end_date"]}
-🏕️ Parks: {parks_text}
-🌙 Nights: {search.get("nights", "auto")}
-"""
-        message_parts.append(search_text)
-    
+
+    message_parts.extend(
+        _LIST_ENTRY_TMPL(
+            i=i,
+            name=search["name"],
+            status="🟢 Enabled" if search.get("enabled", True) else "🔴 Disabled",
+            start_date=search["start_date"],
+            end_date=search["end_date"],
+            parks=", ".join(search["parks"]),
+            nights=search.get("nights", "auto"),
+        )
+        for i, search in enumerate(searches, 1)
+    )
+
     message_parts.append("\nUse `/toggle <name>` to enable/disable or `/delete <name>` to remove.")
-    
+
     return send_telegram_notification(chat_id, "\n".join(message_parts), bot_token)
 
 def handle_toggle_command(chat_id, message_text, bot_token, bucket_name, user_id):
@@ -400,32 +571,30 @@ def handle_toggle_command(chat_id, message_text, bot_token, bucket_name, user_id
     if not config:
         return send_telegram_notification(chat_id, "❌ Error loading your configuration", bot_token)
     
-    # Find and toggle the search (case-insensitive)
-    found = False
-    found_search = None
-    for search in config["searches"]:
-        if search["name"].lower() == search_name.lower():
-            found = True
-            found_search = search
-            search["enabled"] = not search.get("enabled", True)
-            new_status = "enabled" if search["enabled"] else "disabled"
-            
-            if save_user_config(bucket_name, user_id, config):
-                return send_telegram_notification(
-                    chat_id,
-                    f"✅ Search '{search['name']}' is now *{new_status}*",
-                    bot_token
-                )
-            else:
-                return send_telegram_notification(chat_id, "❌ Error saving changes", bot_token)
-    
-    if not found:
+    # Find the search (case-insensitive) - next() stops at the first match
+    wanted = search_name.lower()
+    search = next(
+        (s for s in config["searches"] if s["name"].lower() == wanted), None
+    )
+    if search is None:
         return send_telegram_notification(
             chat_id,
             f"❌ Search '{search_name}' not found. Use `/list` to see your searches.",
             bot_token
         )
 
+    search["enabled"] = not search.get("enabled", True)
+    new_status = "enabled" if search["enabled"] else "disabled"
+
+    if save_user_config(bucket_name, user_id, config):
+        return send_telegram_notification(
+            chat_id,
+            f"✅ Search '{search['name']}' is now *{new_status}*",
+            bot_token
+        )
+    else:
+        return send_telegram_notification(chat_id, "❌ Error saving changes", bot_token)
+
 def handle_delete_command(chat_id, message_text, bot_token, bucket_name, user_id):
     """Handle /delete command"""
     parts = message_text.split(maxsplit=1)
@@ -441,35 +610,36 @@ def handle_delete_command(chat_id, message_text, bot_token, bucket_name, user_id
     if not config:
         return send_telegram_notification(chat_id, "❌ Error loading your configuration", bot_token)
     
-    # Find and remove the search (case-insensitive)
-    original_count = len(config["searches"])
-    found_search_name = None
-    
-    # First find the actual search name (preserve original casing for response)
-    for search in config["searches"]:
-        if search["name"].lower() == search_name.lower():
-            found_search_name = search["name"]
-            break
-    
-    # Remove searches that match (case-insensitive)
-    config["searches"] = [s for s in config["searches"] if s["name"].lower() != search_name.lower()]
-    
-    if len(config["searches"]) < original_count:
-        if save_user_config(bucket_name, user_id, config):
-            return send_telegram_notification(
-                chat_id,
-                f"✅ Deleted search '{found_search_name or search_name}'",
-                bot_token
-            )
-        else:
-            return send_telegram_notification(chat_id, "❌ Error saving changes", bot_token)
-    else:
+    # Find the search index (case-insensitive) and pop it in place - no
+    # list copy, and nothing is rebuilt when there's no match
+    wanted = search_name.lower()
+    index = next(
+        (
+            i for i, s in enumerate(config["searches"])
+            if s["name"].lower() == wanted
+        ),
+        -1,
+    )
+
+    if index < 0:
         return send_telegram_notification(
             chat_id,
             f"❌ Search '{search_name}' not found. Use `/list` to see your searches.",
             bot_token
         )
 
+    # Preserve original casing for the response
+    removed = config["searches"].pop(index)
+
+    if save_user_config(bucket_name, user_id, config):
+        return send_telegram_notification(
+            chat_id,
+            f"✅ Deleted search '{removed['name']}'",
+            bot_token
+        )
+    else:
+        return send_telegram_notification(chat_id, "❌ Error saving changes", bot_token)
+
 def handle_delete_all_command(chat_id, bot_token, bucket_name, user_id):
     """Handle /deleteall command to remove all searches"""
     config = load_user_config(bucket_name, user_id)
@@ -500,82 +670,78 @@ def handle_delete_all_command(chat_id, bot_token, bucket_name, user_id):
 
 def handle_manual_check_request(chat_id, bot_token, bucket_name, user_id):
     """Handle /check command - manually trigger campsite checking via existing Lambda"""
-    print(f"🔍 DEBUG: Starting manual check for user {user_id}")
-    
+    LOG.debug("Starting manual check for user %s", user_id)
+
     config = load_user_config(bucket_name, user_id)
     if not config:
-        print(f"❌ DEBUG: Failed to load config for user {user_id}")
+        LOG.error("Failed to load config for user %s", user_id)
         return send_telegram_notification(chat_id, "❌ Error loading your configuration", bot_token)
-    
-    print(f"🔍 DEBUG: Loaded config with {len(config.get('searches', []))} total searches")
-    
+
     enabled_searches = [s for s in config.get("searches", []) if s.get("enabled", True)]
     if not enabled_searches:
-        print(f"🔍 DEBUG: No enabled searches found")
         return send_telegram_notification(
             chat_id,
             "❌ You don't have any enabled searches to check.\n\nUse `/add` to create a search or `/toggle` to enable existing ones.",
             bot_token
         )
     
-    print(f"🔍 DEBUG: Found {len(enabled_searches)} enabled searches")
-    
+    LOG.debug("Found %s enabled searches", len(enabled_searches))
+
     # Send initial status message
     status_message = f"🔍 Checking {len(enabled_searches)} search(es) for available campsites...\n\nThis may take a few moments."
-    print(f"🔍 DEBUG: Sending initial status message")
     send_telegram_notification(chat_id, status_message, bot_token)
     
     try:
-        # Invoke the existing campsite checking Lambda
-        print(f"🔍 DEBUG: Invoking campbot Lambda for user {user_id}")
-        lambda_client = boto3.client('lambda')
-        
-        # Prepare payload for the campsite checking Lambda
+        # Invoke the campsite checking Lambda asynchronously - campbot posts
+        # its own detailed results back to Telegram, so there's no reason to
+        # hold this webhook open (and pay for two Lambdas) while it scrapes
+        LOG.debug("Invoking campbot Lambda for user %s", user_id)
+        lambda_client = _get_lambda()
+
+        # Prepare payload for the campsite checking Lambda - ship the
+        # config we just loaded so campbot doesn't re-fetch it from S3
         payload = {
             'user_id': str(user_id),
             'manual_check': True,
             'telegram_chat_id': chat_id,
-            'telegram_bot_token': bot_token
+            'telegram_bot_token': bot_token,
+            'prefetched_config': config
         }
-        
-        print(f"🔍 DEBUG: Lambda payload: {json.dumps(payload, indent=2)}")
-        
-        response = lambda_client.invoke(
+
+        lambda_client.invoke(
             FunctionName='campbot',  # Your existing campsite checking Lambda
+            InvocationType='Event',
             Payload=json.dumps(payload)
         )
-        
-        print(f"🔍 DEBUG: Lambda invocation completed with StatusCode: {response['StatusCode']}")
-        
-        # Read the response
-        response_payload = json.loads(response['Payload'].read().decode('utf-8'))
-        print(f"🔍 DEBUG: Lambda response: {json.dumps(response_payload, indent=2)}")
-        
-        # Check if the Lambda execution was successful
-        if response['StatusCode'] == 200:
-            if 'errorMessage' in response_payload:
-                print(f"❌ DEBUG: Lambda returned error: {response_payload['errorMessage']}")
-                error_msg = f"❌ Error during campsite check: {response_payload['errorMessage']}"
-                return send_telegram_notification(chat_id, error_msg, bot_token)
-            else:
-                print(f"✅ DEBUG: Manual check completed successfully")
-                # The campbot Lambda already sent detailed results and summary to Telegram
-                # No need to send additional message here
-                return {"statusCode": 200, "body": "OK"}
-        else:
-            print(f"❌ DEBUG: Lambda invocation failed with status code: {response['StatusCode']}")
-            return send_telegram_notification(
-                chat_id, 
-                "❌ Error invoking campsite checker. Please try again later.",
-                bot_token
-            )
-            
+
+        LOG.debug("Manual check dispatched for user %s", user_id)
+        return {"statusCode": 200, "body": "OK"}
+
     except Exception as e:
-        print(f"❌ DEBUG: Error invoking campbot Lambda: {str(e)}")
-        print(f"❌ DEBUG: Error type: {type(e).__name__}")
+        LOG.error("Error invoking campbot Lambda: %s: %s", type(e).__name__, e)
         error_message = f"❌ Error during manual check: {str(e)}\n\nPlease try again or contact support if the issue persists."
         return send_telegram_notification(chat_id, error_message, bot_token)
 
+# Commands resolved with a single dict lookup on the first token instead of
+# a chain of startswith scans - O(1) dispatch, and '/listfoo' no longer
+# accidentally matches '/list'. Every entry takes the same argument list;
+# handlers that don't need the message text just ignore it.
+_COMMAND_HANDLERS = {
+    '/start': lambda chat_id, text, bot_token, bucket_name, user_id:
+        handle_start_command(chat_id, bot_token),
+    '/help': lambda chat_id, text, bot_token, bucket_name, user_id:
+        handle_start_command(chat_id, bot_token),
+    '/add': handle_add_command,
+    '/list': lambda chat_id, text, bot_token, bucket_name, user_id:
+        handle_list_command(chat_id, bot_token, bucket_name, user_id),
+    '/toggle': handle_toggle_command,
+    '/delete': handle_delete_command,
+    '/deleteall': lambda chat_id, text, bot_token, bucket_name, user_id:
+        handle_delete_all_command(chat_id, bot_token, bucket_name, user_id),
+    '/check': lambda chat_id, text, bot_token, bucket_name, user_id:
+        handle_manual_check_request(chat_id, bot_token, bucket_name, user_id),
+}
+
 def telegram_bot_handler(event, context):
     """
     Main Telegram Bot Lambda handler - processes incoming webhook messages
@@ -603,7 +769,7 @@ def telegram_bot_handler(event, context):
                 "body": json.dumps({"error": "No body in request"})
             }
         
-        update = json.loads(event['body'])
+        update = _json_loads(event['body'])
         
         if 'message' not in update:
             return {"statusCode": 200, "body": "OK"}
@@ -613,41 +779,19 @@ def telegram_bot_handler(event, context):
         user_id = message['from']['id']
         text = message.get('text', '')
         
-        print(f"Received message from user {user_id}: {text}")
+        LOG.info("Received message from user %s: %s", user_id, text)
         
-        # Handle commands
-        if text.startswith('/start'):
-            handle_start_command(chat_id, bot_token)
-        elif text.startswith('/add'):
-            handle_add_command(chat_id, text, bot_token, bucket_name, user_id)
-        elif text.startswith('/list'):
-            handle_list_command(chat_id, bot_token, bucket_name, user_id)
-        elif text.startswith('/toggle'):
-            handle_toggle_command(chat_id, text, bot_token, bucket_name, user_id)
-        elif text.startswith('/deleteall'):
-            handle_delete_all_command(chat_id, bot_token, bucket_name, user_id)
-        elif text.startswith('/delete'):
-            handle_delete_command(chat_id, text, bot_token, bucket_name, user_id)
-        elif text.startswith('/check'):
-            handle_manual_check_request(chat_id, bot_token, bucket_name, user_id)
-        elif text.startswith('/help'):
-            handle_start_command(chat_id, bot_token)  # Same as start
+        # Handle commands - dispatch on the first token, stripping any
+        # @botname mention suffix Telegram appends in group chats.
+        # Whitespace-only text splits to an empty list, so guard it.
+        parts = text.split(maxsplit=1)
+        command = parts[0].split('@')[0] if parts else ''
+        handler = _COMMAND_HANDLERS.get(command)
+        if handler:
+            handler(chat_id, text, bot_token, bucket_name, user_id)
         else:
             # Unknown command
-            help_message = """❓ *Unknown Command*
-
-*Available Commands:*
-• `/add` - Add a new campsite search
-• `/list` - Show your active searches  
-• `/toggle <name>` - Enable/disable a search
-• `/delete <name>` - Remove a search
-• `/deleteall` - Remove all searches (reset)
-• `/check` - Manually check all your searches
-• `/help` - Show help message
-
-Type `/help` for more details!"""
-            
-            send_telegram_notification(chat_id, help_message, bot_token)
+            send_telegram_notification(chat_id, _UNKNOWN_COMMAND_MSG, bot_token)
         
         return {"statusCode": 200, "body": "OK"}
         